@@ -4,9 +4,20 @@ Configuration management with environment variable support
 
 import os
 import json
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
+from typing import Mapping
 from dotenv import load_dotenv
 
+
+@lru_cache(maxsize=None)
+def _warn_missing_credentials(missing: tuple):
+    """Print the missing-credentials hint only the first time it is needed"""
+    print(f"❌ Missing credentials: {', '.join(missing)}")
+    print("📝 Please set these in your .env file")
+
+
 # Load environment variables from .env file
 load_dotenv()
 
@@ -47,31 +58,31 @@ class Config:
     EXPORT_FORMATS = os.getenv('EXPORT_FORMATS', 'json,csv').split(',')
     EXPORT_DIRECTORY = os.getenv('EXPORT_DIRECTORY', './exports')
     
+    # Built once at import - the values above never change afterwards
+    _CREDENTIALS = MappingProxyType({
+        'consumer_key': X_CONSUMER_KEY,
+        'secret_key': X_SECRET_KEY,
+        'bearer_token': X_BEARER_TOKEN,
+        'access_token': X_ACCESS_TOKEN,
+        'access_token_secret': X_ACCESS_TOKEN_SECRET,
+    })
+    _REQUIRED_FIELDS = MappingProxyType({
+        'X_CONSUMER_KEY': X_CONSUMER_KEY,
+        'X_SECRET_KEY': X_SECRET_KEY,
+        'X_BEARER_TOKEN': X_BEARER_TOKEN,
+    })
+    _MISSING = tuple(key for key, value in _REQUIRED_FIELDS.items() if not value)
+    
     @classmethod
-    def get_api_credentials(cls) -> dict:
-        """Get API credentials as dictionary"""
-        return {
-            'consumer_key': cls.X_CONSUMER_KEY,
-            'secret_key': cls.X_SECRET_KEY,
-            'bearer_token': cls.X_BEARER_TOKEN,
-            'access_token': cls.X_ACCESS_TOKEN,
-            'access_token_secret': cls.X_ACCESS_TOKEN_SECRET,
-        }
+    def get_api_credentials(cls) -> Mapping[str, str]:
+        """Get API credentials as a read-only mapping"""
+        return cls._CREDENTIALS
     
     @classmethod
     def validate_credentials(cls) -> bool:
         """Validate that required credentials are set"""
-        required_fields = {
-            'X_CONSUMER_KEY': cls.X_CONSUMER_KEY,
-            'X_SECRET_KEY': cls.X_SECRET_KEY,
-            'X_BEARER_TOKEN': cls.X_BEARER_TOKEN,
-        }
-        
-        missing = [key for key, value in required_fields.items() if not value]
-        
-        if missing:
-            print(f"❌ Missing credentials: {', '.join(missing)}")
-            print("📝 Please set these in your .env file")
+        if cls._MISSING:
+            _warn_missing_credentials(cls._MISSING)
             return False
         
         return True
@@ -5,35 +5,118 @@ Completely configurable, no hardcoded content
 """
 
 import argparse
-import json
+import asyncio
+import os
+import re
 import time
 import logging
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.webdriver.chrome.service import Service
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+from itertools import repeat
+from urllib.parse import quote_plus
+import aiohttp
+import orjson
+from lxml import etree
 from datetime import datetime
 import sqlite3
-from typing import List, Dict
+from typing import Awaitable, Callable, Iterable, List, Dict, Optional, Tuple
 import sys
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+
+# Pause between browser page loads on one Nitter instance: shrinks after each page,
+# doubles (and the page is retried once) when the instance rate limits us (seconds)
+INITIAL_REQUEST_DELAY = 0.5
+MIN_REQUEST_DELAY = 0.25
+MAX_REQUEST_DELAY = 10
+
+# Pages fetched at once from one Nitter instance over HTTP (kept low for rate limits)
+MAX_CONCURRENT_REQUESTS = 10
+
+# Browser processes used to scrape accounts in parallel (kept low for Nitter rate limits)
+BROWSER_WORKERS = 4
+
+# Nitter instances
+NITTER_INSTANCES = [
+    "https://nitter.net",
+    "https://nitter.privacydev.net",
+    "https://nitter.poast.org"
+]
+
+
+def _has_class(name: str) -> str:
+    """XPath predicate equivalent to the CSS class selector .name"""
+    return f'contains(concat(" ", normalize-space(@class), " "), " {name} ")'
+
+
+# Compiled once at import, evaluated against each streamed timeline item
+_X_USERNAME = etree.XPath(f'.//*[{_has_class("username")}]')
+_X_TWEET_CONTENT = etree.XPath(f'.//*[{_has_class("tweet-content")}]')
+_X_TWEET_DATE_LINK = etree.XPath(f'.//*[{_has_class("tweet-date")}]//a')
+_X_STATS = etree.XPath(f'.//*[{_has_class("icon-container")}]')
+
+# Only Nitter's error panel, so a tweet that mentions "rate limited" doesn't trip it
+_XPATH_RATE_LIMITED = (f"//*[{_has_class('error-panel')}]"
+                       "[contains(., 'rate limited') or contains(., 'Rate limited')]")
+
+# Same fields for the browser path, pulled in one WebDriver round-trip per page
+_JS_EXTRACT_TWEETS = """
+const text = (item, selector) => {
+    const elem = item.querySelector(selector);
+    return elem ? elem.innerText : null;
+};
+return Array.from(document.querySelectorAll('.timeline-item')).slice(0, arguments[0]).map(item => {
+    const date = item.querySelector('.tweet-date a');
+    return {
+        username: text(item, '.username'),
+        text: text(item, '.tweet-content'),
+        timestamp: date ? (date.getAttribute('title') || date.innerText) : null,
+        stats: Array.from(item.querySelectorAll('.icon-container'), stat => stat.innerText)
+    };
+});
+"""
+
+
+def chromedriver_path() -> str:
+    """Resolve chromedriver once and reuse it via CHROMEDRIVER_PATH (inherited by worker processes)"""
+    from webdriver_manager.chrome import ChromeDriverManager
+    from webdriver_manager.core.driver_cache import DriverCacheManager
+    
+    path = os.environ.get('CHROMEDRIVER_PATH')
+    if not path or not os.path.exists(path):
+        # Trust webdriver-manager's cached driver for 30 days instead of re-checking online
+        path = ChromeDriverManager(cache_manager=DriverCacheManager(valid_range=30)).install()
+        os.environ['CHROMEDRIVER_PATH'] = path
+    return path
+
 
 def setup_driver():
     """Setup Chrome driver for container environment"""
+    # Selenium is only imported for --browser runs
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.chrome.service import Service
+    
     options = Options()
     options.add_argument('--headless=new')
     options.add_argument('--no-sandbox')
     options.add_argument('--disable-dev-shm-usage')
     options.add_argument('--disable-gpu')
     options.add_argument('--window-size=1920,1080')
-    options.add_argument('--remote-debugging-port=9222')
-    options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
+    options.add_argument(f'user-agent={USER_AGENT}')
+    
+    # Only text is scraped - skip images and don't wait for subresources
+    options.add_argument('--blink-settings=imagesEnabled=false')
+    options.add_experimental_option('prefs', {
+        'profile.managed_default_content_settings.images': 2,
+        'profile.default_content_setting_values.notifications': 2,
+    })
+    options.page_load_strategy = 'eager'
     
-    service = Service(ChromeDriverManager().install())
+    service = Service(chromedriver_path())
     return webdriver.Chrome(service=service, options=options)
 
 
@@ -41,17 +124,94 @@ def load_config(config_file: str = None) -> Dict:
     """Load configuration from JSON file"""
     if config_file:
         try:
-            with open(config_file, 'r') as f:
-                return json.load(f)
+            with open(config_file, 'rb') as f:
+                return orjson.loads(f.read())
         except Exception as e:
             logger.error(f"Error loading config: {e}")
             return {}
     return {}
 
 
+def keyword_pattern(keywords: List[str]) -> Optional[re.Pattern]:
+    """Compile filter keywords into one case-insensitive regex (None = no filter)"""
+    if not keywords:
+        return None
+    return re.compile('|'.join(map(re.escape, keywords)), re.IGNORECASE)
+
+
+def wait_for_timeline(driver, timeout: float = 8):
+    """Wait until the page shows tweets, an empty timeline or an error panel, or the timeout expires"""
+    from selenium.common.exceptions import TimeoutException
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.support.ui import WebDriverWait
+    
+    try:
+        # Empty searches, unknown accounts and rate-limit pages have no timeline items
+        WebDriverWait(driver, timeout).until(EC.presence_of_element_located(
+            (By.CSS_SELECTOR, '.timeline-item, .timeline-none, .error-panel')))
+    except TimeoutException:
+        pass  # The caller checks what actually loaded
+
+
+def load_timeline(driver, url: str, delay: float) -> Optional[float]:
+    """Open a Nitter page, retrying once after a doubled pause if rate limited
+    
+    Returns the pause to keep using, or None if the instance is still rate limiting us.
+    """
+    from selenium.webdriver.common.by import By
+    
+    driver.get(url)
+    wait_for_timeline(driver)
+    if not driver.find_elements(By.XPATH, _XPATH_RATE_LIMITED):
+        return delay
+    
+    delay = min(MAX_REQUEST_DELAY, delay * 2)
+    logger.warning(f"   ⚠️  Rate limited, retrying in {delay:.1f}s...")
+    time.sleep(delay)
+    
+    driver.get(url)
+    wait_for_timeline(driver)
+    if driver.find_elements(By.XPATH, _XPATH_RATE_LIMITED):
+        return None
+    return delay
+
+
+def extract_timeline_browser(driver, max_items: int, require_username: bool = True) -> List[Dict]:
+    """Extract tweets from the page loaded in the browser with a single script call"""
+    results = []
+    
+    for row in driver.execute_script(_JS_EXTRACT_TWEETS, max_items):
+        # Skip items missing an element; empty text (media-only tweets) is kept
+        if row['text'] is None or row['timestamp'] is None:
+            continue
+        if require_username and row['username'] is None:
+            continue
+        
+        # Extract engagement stats
+        stats = row['stats']
+        replies = retweets = likes = "0"
+        if len(stats) >= 3:
+            replies = stats[0].strip() or "0"
+            retweets = stats[1].strip() or "0"
+            likes = stats[2].strip() or "0"
+        
+        results.append({
+            'username': (row['username'] or '').replace('@', '').strip(),
+            'text': row['text'].strip(),
+            'timestamp': row['timestamp'],
+            'likes': likes,
+            'retweets': retweets,
+            'replies': replies,
+        })
+    
+    return results
+
+
 def search_keywords_nitter(driver, nitter_url: str, keywords: List[str], max_results: int = 50) -> List[Dict]:
     """Search for tweets containing keywords"""
     results = []
+    delay = INITIAL_REQUEST_DELAY
     
     for keyword in keywords:
         logger.info(f"🔍 Searching for: '{keyword}'")
@@ -61,58 +221,22 @@ def search_keywords_nitter(driver, nitter_url: str, keywords: List[str], max_res
         url = f"{nitter_url}/search?q={search_query}"
         
         try:
-            driver.get(url)
-            time.sleep(3)
-            
-            # Check for rate limit
-            if 'rate limited' in driver.page_source.lower():
+            delay = load_timeline(driver, url, delay)
+            if delay is None:
                 logger.warning(f"   ⚠️  Rate limited on {nitter_url}")
                 return None
             
-            # Find tweet items
-            tweets = driver.find_elements(By.CSS_SELECTOR, '.timeline-item')
+            tweets = extract_timeline_browser(driver, max_results)
             logger.info(f"   Found {len(tweets)} results")
             
-            for tweet in tweets[:max_results]:
-                try:
-                    # Extract username
-                    username_elem = tweet.find_element(By.CSS_SELECTOR, '.username')
-                    username = username_elem.text.replace('@', '').strip()
-                    
-                    # Extract tweet content
-                    text_elem = tweet.find_element(By.CSS_SELECTOR, '.tweet-content')
-                    text = text_elem.text.strip()
-                    
-                    # Extract timestamp
-                    time_elem = tweet.find_element(By.CSS_SELECTOR, '.tweet-date a')
-                    timestamp = time_elem.get_attribute('title') or time_elem.text
-                    
-                    # Extract engagement stats
-                    stats = tweet.find_elements(By.CSS_SELECTOR, '.icon-container')
-                    replies = retweets = likes = "0"
-                    try:
-                        if len(stats) >= 3:
-                            replies = stats[0].text.strip() or "0"
-                            retweets = stats[1].text.strip() or "0"
-                            likes = stats[2].text.strip() or "0"
-                    except:
-                        pass
-                    
-                    results.append({
-                        'username': username,
-                        'text': text,
-                        'timestamp': timestamp,
-                        'likes': likes,
-                        'retweets': retweets,
-                        'replies': replies,
-                        'keyword': keyword,
-                        'scraped_at': datetime.now().isoformat()
-                    })
-                    
-                except Exception as e:
-                    continue
+            scraped_at = datetime.now().isoformat()
+            for tweet in tweets:
+                tweet['keyword'] = keyword
+                tweet['scraped_at'] = scraped_at
+                results.append(tweet)
             
-            time.sleep(2)
+            time.sleep(delay)
+            delay = max(MIN_REQUEST_DELAY, delay * 0.8)
             
         except Exception as e:
             logger.error(f"   ❌ Error searching '{keyword}': {str(e)[:50]}")
@@ -124,61 +248,33 @@ def search_keywords_nitter(driver, nitter_url: str, keywords: List[str], max_res
 def scrape_accounts(driver, nitter_url: str, accounts: List[str], max_tweets: int = 15, keyword_filter: List[str] = None) -> List[Dict]:
     """Scrape specific accounts"""
     results = []
+    pattern = keyword_pattern(keyword_filter)
+    delay = INITIAL_REQUEST_DELAY
     
     for account in accounts:
         logger.info(f"   📱 Scraping @{account}...")
         url = f"{nitter_url}/{account}"
         
         try:
-            driver.get(url)
-            time.sleep(3)
-            
-            # Check for rate limit
-            if 'rate limited' in driver.page_source.lower():
+            delay = load_timeline(driver, url, delay)
+            if delay is None:
                 logger.warning(f"   ⚠️  Rate limited")
                 return None
             
-            tweets = driver.find_elements(By.CSS_SELECTOR, '.timeline-item')
-            
-            for tweet in tweets[:max_tweets]:
-                try:
-                    text_elem = tweet.find_element(By.CSS_SELECTOR, '.tweet-content')
-                    time_elem = tweet.find_element(By.CSS_SELECTOR, '.tweet-date a')
-                    stats = tweet.find_elements(By.CSS_SELECTOR, '.icon-container')
-                    
-                    text = text_elem.text.strip()
-                    
-                    # Filter by keywords if provided
-                    if keyword_filter:
-                        text_lower = text.lower()
-                        if not any(kw.lower() in text_lower for kw in keyword_filter):
-                            continue
-                    
-                    # Extract engagement
-                    replies = retweets = likes = "0"
-                    try:
-                        if len(stats) >= 3:
-                            replies = stats[0].text.strip() or "0"
-                            retweets = stats[1].text.strip() or "0"
-                            likes = stats[2].text.strip() or "0"
-                    except:
-                        pass
-                    
-                    results.append({
-                        'username': account,
-                        'text': text,
-                        'timestamp': time_elem.get_attribute('title') or time_elem.text,
-                        'likes': likes,
-                        'retweets': retweets,
-                        'replies': replies,
-                        'scraped_at': datetime.now().isoformat()
-                    })
-                    
-                except Exception as e:
+            found_before = len(results)
+            scraped_at = datetime.now().isoformat()
+            for tweet in extract_timeline_browser(driver, max_tweets, require_username=False):
+                # Filter by keywords if provided
+                if pattern and not pattern.search(tweet['text']):
                     continue
+                
+                tweet['username'] = account
+                tweet['scraped_at'] = scraped_at
+                results.append(tweet)
             
-            logger.info(f"   ✅ Found {len([r for r in results if r['username'] == account])} tweets")
-            time.sleep(1)
+            logger.info(f"   ✅ Found {len(results) - found_before} tweets")
+            time.sleep(delay)
+            delay = max(MIN_REQUEST_DELAY, delay * 0.8)
             
         except Exception as e:
             logger.error(f"   ❌ Error: {str(e)[:50]}")
@@ -187,9 +283,320 @@ def scrape_accounts(driver, nitter_url: str, accounts: List[str], max_tweets: in
     return results
 
 
+def _scrape_accounts_worker(accounts: List[str], nitter_url: str, max_tweets: int,
+                            keyword_filter: List[str]) -> Optional[List[Dict]]:
+    """Process pool worker - Selenium is not thread-safe, so each process owns a driver"""
+    driver = setup_driver()
+    try:
+        return scrape_accounts(driver, nitter_url, accounts, max_tweets, keyword_filter)
+    finally:
+        driver.quit()
+
+
+def scrape_accounts_parallel(nitter_url: str, accounts: List[str], max_tweets: int = 15,
+                             keyword_filter: List[str] = None) -> Optional[List[Dict]]:
+    """Scrape accounts across a pool of browser processes"""
+    # Contiguous chunks so results come back in input account order
+    size = -(-len(accounts) // BROWSER_WORKERS)
+    batches = [accounts[i:i + size] for i in range(0, len(accounts), size)]
+    results = []
+    rate_limited = False
+    
+    # Resolve the driver once here; workers pick it up from CHROMEDRIVER_PATH
+    chromedriver_path()
+    
+    with ProcessPoolExecutor(max_workers=len(batches)) as executor:
+        for batch in executor.map(_scrape_accounts_worker, batches, repeat(nitter_url),
+                                  repeat(max_tweets), repeat(keyword_filter)):
+            if batch is None:
+                rate_limited = True
+            else:
+                results.extend(batch)
+    
+    return None if rate_limited else results
+
+
+def _text(elem) -> str:
+    """Text content of an element and its descendants"""
+    return ''.join(elem.itertext())
+
+
+def parse_timeline(page: bytes, max_items: int) -> List[Dict]:
+    """Extract tweets from a Nitter timeline/search page
+    
+    Streams the page and frees each timeline item once parsed, so memory stays
+    flat regardless of page size. Nitter serves UTF-8.
+    """
+    results = []
+    if max_items <= 0 or not page.strip():
+        return results
+    
+    seen = 0
+    for _, item in etree.iterparse(BytesIO(page), tag='div', html=True, encoding='utf-8'):
+        if 'timeline-item' not in (item.get('class') or '').split():
+            continue
+        
+        username_elem = _X_USERNAME(item)
+        text_elem = _X_TWEET_CONTENT(item)
+        time_elem = _X_TWEET_DATE_LINK(item)
+        
+        if username_elem and text_elem and time_elem:
+            # Extract engagement stats
+            stats = _X_STATS(item)
+            replies = retweets = likes = "0"
+            if len(stats) >= 3:
+                replies = _text(stats[0]).strip() or "0"
+                retweets = _text(stats[1]).strip() or "0"
+                likes = _text(stats[2]).strip() or "0"
+            
+            results.append({
+                'username': _text(username_elem[0]).replace('@', '').strip(),
+                'text': _text(text_elem[0]).strip(),
+                'timestamp': time_elem[0].get('title') or _text(time_elem[0]),
+                'likes': likes,
+                'retweets': retweets,
+                'replies': replies,
+            })
+        
+        # Free the parsed item and the already-processed siblings before it
+        item.clear()
+        while item.getprevious() is not None:
+            del item.getparent()[0]
+        
+        seen += 1
+        if seen >= max_items:
+            break
+    
+    return results
+
+
+async def fetch_page(session: aiohttp.ClientSession, url: str) -> Optional[bytes]:
+    """Fetch a Nitter page over HTTP, returns None if rate limited"""
+    async with session.get(url) as response:
+        if response.status in (429, 503):
+            return None
+        page = await response.read()
+    
+    # Some instances answer 200 with an error page; only those get the text scan
+    if b'timeline-item' not in page and b'rate limited' in page.lower():
+        return None
+    return page
+
+
+async def gather_until_rate_limited(fetch: Callable[[str], Awaitable[Optional[list]]],
+                                   items: Iterable[str]) -> List[Optional[list]]:
+    """Run fetch over items concurrently, skipping what has not started once one is rate limited
+    
+    A None result means that item was rate limited or skipped.
+    """
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    rate_limited = asyncio.Event()
+    
+    async def fetch_one(item: str) -> Optional[list]:
+        async with semaphore:
+            # Stop hitting an instance once it has rate limited us
+            if rate_limited.is_set():
+                return None
+            result = await fetch(item)
+        
+        if result is None:
+            rate_limited.set()
+        return result
+    
+    return await asyncio.gather(*(fetch_one(item) for item in items))
+
+
+async def search_keywords_http(session: aiohttp.ClientSession, nitter_url: str, keywords: List[str],
+                               max_results: int = 50) -> Optional[List[Dict]]:
+    """Search for tweets containing keywords, fetching keywords concurrently"""
+    
+    async def search_one(keyword: str) -> Optional[List[Dict]]:
+        logger.info(f"🔍 Searching for: '{keyword}'")
+        url = f"{nitter_url}/search?q={quote_plus(keyword)}"
+        
+        try:
+            page = await fetch_page(session, url)
+        except Exception as e:
+            logger.error(f"   ❌ Error searching '{keyword}': {str(e)[:50]}")
+            return []
+        
+        if page is None:
+            logger.warning(f"   ⚠️  Rate limited on {nitter_url}")
+            return None
+        
+        tweets = parse_timeline(page, max_results)
+        logger.info(f"   Found {len(tweets)} results for '{keyword}'")
+        
+        scraped_at = datetime.now().isoformat()
+        for tweet in tweets:
+            tweet['keyword'] = keyword
+            tweet['scraped_at'] = scraped_at
+        return tweets
+    
+    batches = await gather_until_rate_limited(search_one, keywords)
+    if any(batch is None for batch in batches):
+        return None
+    return [tweet for batch in batches for tweet in batch]
+
+
+async def scrape_accounts_http(session: aiohttp.ClientSession, nitter_url: str, accounts: List[str],
+                               max_tweets: int = 15, keyword_filter: List[str] = None) -> Optional[List[Dict]]:
+    """Scrape specific accounts, fetching accounts concurrently"""
+    pattern = keyword_pattern(keyword_filter)
+    
+    async def scrape_one(account: str) -> Optional[List[Dict]]:
+        logger.info(f"   📱 Scraping @{account}...")
+        
+        try:
+            page = await fetch_page(session, f"{nitter_url}/{account}")
+        except Exception as e:
+            logger.error(f"   ❌ Error on @{account}: {str(e)[:50]}")
+            return []
+        
+        if page is None:
+            logger.warning(f"   ⚠️  Rate limited")
+            return None
+        
+        results = []
+        scraped_at = datetime.now().isoformat()
+        for tweet in parse_timeline(page, max_tweets):
+            # Filter by keywords if provided
+            if pattern and not pattern.search(tweet['text']):
+                continue
+            
+            tweet['username'] = account
+            tweet['scraped_at'] = scraped_at
+            results.append(tweet)
+        
+        logger.info(f"   ✅ @{account}: found {len(results)} tweets")
+        return results
+    
+    batches = await gather_until_rate_limited(scrape_one, accounts)
+    if any(batch is None for batch in batches):
+        return None
+    return [tweet for batch in batches for tweet in batch]
+
+
+async def open_http_session() -> aiohttp.ClientSession:
+    """Create the keep-alive HTTP session shared by every request of a run"""
+    connector = aiohttp.TCPConnector(limit=64, limit_per_host=16, ttl_dns_cache=300, keepalive_timeout=60)
+    timeout = aiohttp.ClientTimeout(total=30)
+    return aiohttp.ClientSession(connector=connector, timeout=timeout, headers={'User-Agent': USER_AGENT})
+
+
+async def probe_instance(session: aiohttp.ClientSession, nitter_url: str) -> Optional[str]:
+    """Cheap search request, returns the instance URL if it answers 200"""
+    try:
+        async with session.get(f"{nitter_url}/search?q=a", timeout=aiohttp.ClientTimeout(total=5)) as response:
+            return nitter_url if response.status == 200 else None
+    except (aiohttp.ClientError, asyncio.TimeoutError):
+        return None
+
+
+async def rank_instances(session: aiohttp.ClientSession, nitter_instances: List[str]) -> List[str]:
+    """Probe all instances concurrently and move the first healthy one to the front"""
+    pending = {asyncio.ensure_future(probe_instance(session, url)) for url in nitter_instances}
+    winner = None
+    
+    while pending and not winner:
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        winner = next((task.result() for task in done if task.result()), None)
+    
+    for task in pending:
+        task.cancel()
+    await asyncio.gather(*pending, return_exceptions=True)
+    
+    if not winner:
+        return list(nitter_instances)
+    logger.info(f"⚡ Fastest instance: {winner}")
+    return [winner] + [url for url in nitter_instances if url != winner]
+
+
+async def scrape_instance_http(session: aiohttp.ClientSession, nitter_url: str, keywords: List[str],
+                               accounts: List[str], max_tweets: int) -> Tuple[List[Dict], bool]:
+    """Scrape one Nitter instance over HTTP, returns (tweets, instance_works)"""
+    tweets = []
+    
+    # Search by keywords
+    if keywords:
+        logger.info("\n🔍 Searching by keywords...")
+        results = await search_keywords_http(session, nitter_url, keywords, max_tweets)
+        
+        if results is None:
+            return tweets, False
+        if results:
+            tweets.extend(results)
+            logger.info(f"✅ Found {len(results)} tweets from keyword search")
+    
+    # Scrape specific accounts
+    if accounts:
+        logger.info(f"\n👥 Scraping {len(accounts)} accounts...")
+        results = await scrape_accounts_http(session, nitter_url, accounts, max_tweets, keywords)
+        
+        if results is None:
+            return tweets, False
+        if results:
+            tweets.extend(results)
+            logger.info(f"✅ Found {len(results)} tweets from accounts")
+    
+    return tweets, True
+
+
+def scrape_instance_browser(driver, nitter_url: str, keywords: List[str], accounts: List[str],
+                            max_tweets: int) -> Tuple[List[Dict], bool]:
+    """Scrape one Nitter instance with Selenium, returns (tweets, instance_works)"""
+    tweets = []
+    
+    # Search by keywords
+    if keywords:
+        logger.info("\n🔍 Searching by keywords...")
+        results = search_keywords_nitter(driver, nitter_url, keywords, max_tweets)
+        
+        if results is None:
+            return tweets, False
+        if results:
+            tweets.extend(results)
+            logger.info(f"✅ Found {len(results)} tweets from keyword search")
+    
+    # Scrape specific accounts
+    if accounts:
+        logger.info(f"\n👥 Scraping {len(accounts)} accounts...")
+        results = scrape_accounts_parallel(nitter_url, accounts, max_tweets, keywords)
+        
+        if results is None:
+            return tweets, False
+        if results:
+            tweets.extend(results)
+            logger.info(f"✅ Found {len(results)} tweets from accounts")
+    
+    return tweets, True
+
+
+def ensure_unique_index(conn: sqlite3.Connection, name: str, columns: Tuple[str, ...]):
+    """Create a unique index on the tweets table if missing, first dropping duplicate rows"""
+    if conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = ?", (name,)).fetchone():
+        return
+    
+    # Databases from older runs may already hold duplicates that would block the index.
+    # NULLs never collide in a unique index, so only rows with a full key are deduplicated.
+    column_list = ', '.join(columns)
+    full_key = ' AND '.join(f'{column} IS NOT NULL' for column in columns)
+    with conn:
+        removed = conn.execute(f'''
+            DELETE FROM tweets WHERE {full_key} AND id NOT IN (
+                SELECT MIN(id) FROM tweets WHERE {full_key} GROUP BY {column_list}
+            )
+        ''').rowcount
+        conn.execute(f'CREATE UNIQUE INDEX {name} ON tweets({column_list})')
+    
+    if removed:
+        logger.info(f"🧹 Removed {removed} duplicate tweets before creating index {name}")
+
+
 def save_to_database(tweets: List[Dict], db_name: str = "scraped_tweets.db"):
     """Save tweets to SQLite database"""
     conn = sqlite3.connect(db_name)
+    conn.executescript("PRAGMA journal_mode=WAL; PRAGMA synchronous=NORMAL;")
     cursor = conn.cursor()
     
     cursor.execute('''
@@ -206,11 +613,11 @@ def save_to_database(tweets: List[Dict], db_name: str = "scraped_tweets.db"):
         )
     ''')
     
-    for tweet in tweets:
-        cursor.execute('''
-            INSERT INTO tweets (username, text, timestamp, likes, retweets, replies, keyword, scraped_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
+    cursor.execute('DROP INDEX IF EXISTS ux_tweets_user_ts')  # Earlier name of the index below
+    ensure_unique_index(conn, 'ux_tweets_user_ts_text', ('username', 'timestamp', 'text'))
+    
+    rows = [
+        (
             tweet.get('username'),
             tweet.get('text'),
             tweet.get('timestamp'),
@@ -219,15 +626,29 @@ def save_to_database(tweets: List[Dict], db_name: str = "scraped_tweets.db"):
             tweet.get('replies'),
             tweet.get('keyword', ''),
             tweet.get('scraped_at')
-        ))
+        )
+        for tweet in tweets
+    ]
+    
+    # Single transaction for the whole batch, already-stored tweets are skipped
+    changes_before = conn.total_changes
+    with conn:
+        cursor.executemany('''
+            INSERT OR IGNORE INTO tweets (username, text, timestamp, likes, retweets, replies, keyword, scraped_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        ''', rows)
+    new_tweets = conn.total_changes - changes_before
     
-    conn.commit()
     conn.close()
-    logger.info(f"✅ Saved {len(tweets)} tweets to {db_name}")
+    logger.info(f"✅ Saved {new_tweets} new tweets to {db_name} ({len(tweets) - new_tweets} already stored)")
 
 
 def display_results(tweets: List[Dict], max_display: int = 20):
     """Display scraped tweets"""
+    # Nobody is watching a redirected stdout (cron, pipes) - set FORCE_DISPLAY=1 to override
+    if not sys.stdout.isatty() and not os.environ.get('FORCE_DISPLAY'):
+        return
+    
     if not tweets:
         print("\n❌ No tweets found")
         return
@@ -304,7 +725,8 @@ def interactive_mode():
     }
 
 
-def main():
+def parse_args(argv: List[str] = None) -> argparse.Namespace:
+    """Parse command-line arguments"""
     parser = argparse.ArgumentParser(
         description='Generic Twitter/X Scraper - Search ANY topics (Account scraping recommended)',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -342,53 +764,21 @@ NOTE: Account scraping (-a) is more reliable than keyword search (-k only).
                        help='Load configuration from JSON file')
     parser.add_argument('--no-display', action='store_true',
                        help='Don\'t display results (only save to database)')
+    parser.add_argument('--browser', action='store_true',
+                       help='Fetch pages with headless Chrome instead of plain HTTP')
+    parser.add_argument('-y', '--yes', action='store_true',
+                       help='Never prompt (for schedulers and scripts)')
     
-    args = parser.parse_args()
-    
-    # Load config from file if provided
-    config = load_config(args.config) if args.config else {}
-    
-    # Get parameters
-    keywords = None
-    accounts = None
-    max_tweets = args.max_tweets
-    db_name = args.database
-    
-    if config:
-        keywords = config.get('keywords', [])
-        accounts = config.get('accounts', [])
-        max_tweets = config.get('max_tweets', max_tweets)
-        db_name = config.get('database', db_name)
-    elif args.keywords or args.accounts:
-        keywords = [k.strip() for k in args.keywords.split(',') if k.strip()] if args.keywords else []
-        accounts = [a.strip().replace('@', '') for a in args.accounts.split(',') if a.strip()] if args.accounts else []
-    else:
-        # Interactive mode
-        params = interactive_mode()
-        if not params:
-            return
-        keywords = params['keywords']
-        accounts = params['accounts']
-        max_tweets = params['max_tweets']
-        db_name = params['db_name']
-    
-    if not keywords and not accounts:
-        print("\n❌ No keywords or accounts specified!")
-        print("   Use -a for accounts (recommended) or -k for keywords")
-        print("   Run without args for interactive mode: python generic_scraper.py")
-        return
-    
-    # Warn if only keywords provided
-    if keywords and not accounts:
-        print("\n⚠️  WARNING: Keyword-only search is unreliable on Nitter")
-        print("   Recommendation: Add accounts with -a for better results")
-        print("   Example: python generic_scraper.py -a 'CNN,BBC' -k 'your keywords'")
-        print("\n   Continue with keyword-only search? (y/n): ", end='')
-        import sys
-        choice = sys.stdin.readline().strip().lower()
-        if choice != 'y':
-            print("   Cancelled. Try adding accounts for better results!")
-            return
+    return parser.parse_args(argv)
+
+
+def run(keywords: List[str] = None, accounts: List[str] = None, max_tweets: int = 20,
+        database: str = 'scraped_tweets.db', display: bool = True, use_browser: bool = False) -> List[Dict]:
+    """Scrape keywords/accounts and save them (in-process entry point, no prompts)"""
+    # Drop repeated inputs (keeping order) so nothing is fetched twice
+    keywords = list(dict.fromkeys(keywords or []))
+    accounts = list(dict.fromkeys(accounts or []))
+    db_name = database
     
     print("\n" + "=" * 80)
     print("🚀 GENERIC TWITTER SCRAPER")
@@ -401,47 +791,34 @@ NOTE: Account scraping (-a) is more reliable than keyword search (-k only).
     print(f"📊 Max tweets: {max_tweets}")
     print(f"💾 Database: {db_name}")
     
-    # Nitter instances
-    nitter_instances = [
-        "https://nitter.net",
-        "https://nitter.privacydev.net",
-        "https://nitter.poast.org"
-    ]
-    
+    nitter_instances = NITTER_INSTANCES
     all_tweets = []
     driver = None
+    loop = None
+    session = None
     
     try:
-        driver = setup_driver()
-        logger.info("✅ Browser initialized")
+        if use_browser:
+            # Accounts get their own browsers in worker processes
+            if keywords:
+                driver = setup_driver()
+                logger.info("✅ Browser initialized")
+        else:
+            # One event loop and one keep-alive session for every instance
+            loop = asyncio.new_event_loop()
+            session = loop.run_until_complete(open_http_session())
+            nitter_instances = loop.run_until_complete(rank_instances(session, NITTER_INSTANCES))
         
         # Try nitter instances
         for nitter_url in nitter_instances:
             logger.info(f"\n🔄 Using: {nitter_url}")
             
-            instance_works = True
-            
-            # Search by keywords
-            if keywords:
-                logger.info("\n🔍 Searching by keywords...")
-                results = search_keywords_nitter(driver, nitter_url, keywords, max_tweets)
-                
-                if results is None:
-                    instance_works = False
-                elif results:
-                    all_tweets.extend(results)
-                    logger.info(f"✅ Found {len(results)} tweets from keyword search")
-            
-            # Scrape specific accounts
-            if accounts and instance_works:
-                logger.info(f"\n👥 Scraping {len(accounts)} accounts...")
-                results = scrape_accounts(driver, nitter_url, accounts, max_tweets, keywords)
-                
-                if results is None:
-                    instance_works = False
-                elif results:
-                    all_tweets.extend(results)
-                    logger.info(f"✅ Found {len(results)} tweets from accounts")
+            if use_browser:
+                results, instance_works = scrape_instance_browser(driver, nitter_url, keywords, accounts, max_tweets)
+            else:
+                results, instance_works = loop.run_until_complete(
+                    scrape_instance_http(session, nitter_url, keywords, accounts, max_tweets))
+            all_tweets.extend(results)
             
             if instance_works and all_tweets:
                 logger.info(f"\n✅ Successfully scraped using {nitter_url}")
@@ -456,7 +833,7 @@ NOTE: Account scraping (-a) is more reliable than keyword search (-k only).
             save_to_database(all_tweets, db_name)
             
             # Display results
-            if not args.no_display:
+            if display:
                 display_results(all_tweets)
             
             print("\n" + "=" * 80)
@@ -475,6 +852,64 @@ NOTE: Account scraping (-a) is more reliable than keyword search (-k only).
     finally:
         if driver:
             driver.quit()
+        if session:
+            loop.run_until_complete(session.close())
+        if loop:
+            loop.close()
+    
+    return all_tweets
+
+
+def main():
+    args = parse_args()
+    
+    # Load config from file if provided
+    config = load_config(args.config) if args.config else {}
+    
+    # Get parameters
+    keywords = None
+    accounts = None
+    max_tweets = args.max_tweets
+    db_name = args.database
+    
+    if config:
+        keywords = config.get('keywords', [])
+        accounts = config.get('accounts', [])
+        max_tweets = config.get('max_tweets', max_tweets)
+        db_name = config.get('database', db_name)
+    elif args.keywords or args.accounts:
+        keywords = [k.strip() for k in args.keywords.split(',') if k.strip()] if args.keywords else []
+        accounts = [a.strip().replace('@', '') for a in args.accounts.split(',') if a.strip()] if args.accounts else []
+    elif not args.yes and sys.stdin.isatty():
+        # Interactive mode
+        params = interactive_mode()
+        if not params:
+            return
+        keywords = params['keywords']
+        accounts = params['accounts']
+        max_tweets = params['max_tweets']
+        db_name = params['db_name']
+    
+    if not keywords and not accounts:
+        print("\n❌ No keywords or accounts specified!")
+        print("   Use -a for accounts (recommended) or -k for keywords")
+        print("   Run without args for interactive mode: python generic_scraper.py")
+        return
+    
+    # Warn if only keywords provided
+    if keywords and not accounts:
+        print("\n⚠️  WARNING: Keyword-only search is unreliable on Nitter")
+        print("   Recommendation: Add accounts with -a for better results")
+        print("   Example: python generic_scraper.py -a 'CNN,BBC' -k 'your keywords'")
+        if not args.yes and sys.stdin.isatty():
+            print("\n   Continue with keyword-only search? (y/n): ", end='')
+            choice = sys.stdin.readline().strip().lower()
+            if choice != 'y':
+                print("   Cancelled. Try adding accounts for better results!")
+                return
+    
+    run(keywords=keywords, accounts=accounts, max_tweets=max_tweets,
+        database=db_name, display=not args.no_display, use_browser=args.browser)
 
 
 if __name__ == "__main__":